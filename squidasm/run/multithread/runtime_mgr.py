@@ -1,3 +1,4 @@
+import queue
 import threading
 from multiprocessing.pool import ThreadPool
 from typing import Any, Dict, Optional
@@ -22,7 +23,6 @@ from squidasm.sim.network import reset_network
 from squidasm.sim.network.network import NetSquidNetwork
 from squidasm.sim.network.nv_config import NVConfig
 from squidasm.sim.queues import QueueManager
-from squidasm.util.thread import as_completed
 
 _logger = get_netqasm_logger()
 
@@ -39,6 +39,9 @@ class SquidAsmRuntimeManager(RuntimeManager):
         self._party_map: Dict[str, NetSquidNode] = dict()
         self._backend_thread = None
         self._backend_log_dir: Optional[str] = None
+        # Threads that run the programs, reused by consecutive calls to run_app.
+        self._program_pool: Optional[ThreadPool] = None
+        self._program_pool_size: int = 0
 
         self.reset_backend()
 
@@ -138,6 +141,7 @@ class SquidAsmRuntimeManager(RuntimeManager):
             subroutine_handler.stop()
         self._backend_thread.join()
         self._backend_thread = None
+        self._close_program_pool()
         SharedMemoryManager.reset_memories()
         QueueManager.destroy_queues()
         reset_network()
@@ -178,10 +182,17 @@ class SquidAsmRuntimeManager(RuntimeManager):
         for party, node_name in app_instance.party_alloc.items():
             self._party_map[party] = self.network.get_node(node_name)
 
-        with ThreadPool(len(programs) + 1) as executor:
+        executor = self._get_program_pool(len(programs))
+        try:
+            # Indices of finished programs, in the order in which they finish.
+            finished: "queue.SimpleQueue[int]" = queue.SimpleQueue()
+
             # Start the program threads
             program_futures = []
-            for program in programs:
+            # NOTE: use app_<name> instead of prog_<name> for now for backward compatibility
+            names = []
+            for i, program in enumerate(programs):
+                names.append(f"app_{program.party}")
                 inputs = app_instance.program_inputs[program.party]
                 if use_app_config:
                     app_cfg = AppConfig(
@@ -192,24 +203,51 @@ class SquidAsmRuntimeManager(RuntimeManager):
                         inputs=inputs,
                     )
                     inputs["app_config"] = app_cfg
-                future = executor.apply_async(program.entry, kwds=inputs)
+                future = executor.apply_async(
+                    program.entry,
+                    kwds=inputs,
+                    callback=lambda _, i=i: finished.put(i),
+                    error_callback=lambda _, i=i: finished.put(i),
+                )
                 program_futures.append(future)
 
             # Join the application threads and the backend
-            program_names = [program.party for program in app_instance.app.programs]
-            # NOTE: use app_<name> instead of prog_<name> for now for backward compatibility
-            names = [f"app_{prog_name}" for prog_name in program_names]
             results = {}
-            for future, name in as_completed(program_futures, names=names):
-                results[name] = future.get()
-
-            if save_loggers:
-                save_all_struct_loggers()
-            reset_struct_loggers()
-            reset_socket_hub()
-            ThreadSocket._COMM_LOGGERS = {}
+            # Block until each program finishes, so that an error is raised as soon
+            # as it happens, even if other programs are still running.
+            for _ in range(len(program_futures)):
+                i = finished.get()
+                results[names[i]] = program_futures[i].get()
+        except BaseException:
+            # Programs that are still running would keep their threads busy, so do
+            # not reuse this pool for a next run.
+            self._close_program_pool()
+            raise
 
-            return results
+        if save_loggers:
+            save_all_struct_loggers()
+        reset_struct_loggers()
+        reset_socket_hub()
+        ThreadSocket._COMM_LOGGERS = {}
+
+        return results
+
+    def _get_program_pool(self, num_programs: int) -> ThreadPool:
+        """Get a pool with a thread for each of `num_programs` programs.
+
+        All programs of an application run at the same time, so the pool is
+        replaced if it has too few threads."""
+        if self._program_pool is None or self._program_pool_size < num_programs:
+            self._close_program_pool()
+            self._program_pool = ThreadPool(max(num_programs, 1))
+            self._program_pool_size = num_programs
+        return self._program_pool
+
+    def _close_program_pool(self) -> None:
+        if self._program_pool is not None:
+            self._program_pool.terminate()
+            self._program_pool = None
+            self._program_pool_size = 0
 
     def _create_subroutine_handlers(self):
         self._subroutine_handlers: Dict[str, SubroutineHandler] = dict()
@@ -1,6 +1,7 @@
 import os
 from typing import Any, Callable, Dict, List, Optional
 
+from netqasm.logging.glob import get_netqasm_logger
 from netqasm.runtime import env
 from netqasm.runtime.application import ApplicationInstance, load_yaml_file
 from netqasm.runtime.interface.config import (
@@ -17,6 +18,12 @@ from netsquid import QFormalism
 from squidasm.run.multithread.runtime_mgr import SquidAsmRuntimeManager
 from squidasm.sim.network.nv_config import NVConfig, parse_nv_config
 
+_logger = get_netqasm_logger()
+
+# Number of rounds after which results.yaml is rewritten, even if the log directory
+# does not change. This bounds the number of rounds lost if the process is killed.
+_RESULTS_WRITE_INTERVAL = 10
+
 _NS_FORMALISMS = {
     Formalism.STAB: QFormalism.STAB,
     Formalism.KET: QFormalism.KET,
@@ -49,7 +56,7 @@ def simulate_application(
     mgr.netsquid_formalism = _NS_FORMALISMS[formalism]
 
     if network_cfg is None:
-        node_names = [name for name in app_instance.party_alloc.keys()]
+        node_names = list(app_instance.party_alloc)
         if hardware == "nv":
             hardware = QuantumHardware.NV
         elif hardware == "generic":
@@ -67,34 +74,63 @@ def simulate_application(
         log_dir = (
             os.path.abspath("./log") if log_cfg.log_dir is None else log_cfg.log_dir
         )
-        if not os.path.exists(log_dir):
-            os.mkdir(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
 
     timed_log_dir: Optional[str] = None
+    results_path: Optional[str] = None
 
     mgr.start_backend()
 
     results = []
-
-    for _ in range(num_rounds):
-        if enable_logging:
-            assert log_cfg is not None
-            if log_cfg.split_runs or timed_log_dir is None:
-                # create new timed directory for next run or for first run
-                timed_log_dir = env.get_timed_log_dir(log_dir)
-
-            mgr.backend_log_dir = timed_log_dir
-            app_instance.logging_cfg.log_subroutines_dir = timed_log_dir
-            app_instance.logging_cfg.comm_log_dir = timed_log_dir
-        result = mgr.run_app(app_instance, use_app_config=use_app_config)
-        results.append(result)
-
-        if enable_logging:
-            assert timed_log_dir is not None
-            path = os.path.join(timed_log_dir, "results.yaml")
-            dump_yaml(data=results, file_path=path)
-
-        SharedMemoryManager.reset_memories()
+    # Number of rounds in `results` that are not yet written to `results_path`.
+    unwritten_rounds = 0
+
+    # The results file holds the results of all rounds so far. Rewriting it after
+    # every round makes long runs quadratic, so it is written every
+    # _RESULTS_WRITE_INTERVAL rounds, before moving on to a new log directory, and
+    # after the last round.
+    try:
+        for _ in range(num_rounds):
+            if enable_logging:
+                assert log_cfg is not None
+                if log_cfg.split_runs or timed_log_dir is None:
+                    if unwritten_rounds > 0:
+                        assert results_path is not None
+                        dump_yaml(data=results, file_path=results_path)
+                        unwritten_rounds = 0
+                    # create new timed directory for next run or for first run
+                    timed_log_dir = env.get_timed_log_dir(log_dir)
+                    app_instance.logging_cfg.log_subroutines_dir = timed_log_dir
+                    app_instance.logging_cfg.comm_log_dir = timed_log_dir
+                    results_path = os.path.join(timed_log_dir, "results.yaml")
+
+                # Also needed if the directory did not change, since run_app resets
+                # the structured loggers after each run and this creates them again.
+                mgr.backend_log_dir = timed_log_dir
+            result = mgr.run_app(app_instance, use_app_config=use_app_config)
+            results.append(result)
+
+            if enable_logging:
+                unwritten_rounds += 1
+                if unwritten_rounds >= _RESULTS_WRITE_INTERVAL:
+                    assert results_path is not None
+                    dump_yaml(data=results, file_path=results_path)
+                    unwritten_rounds = 0
+
+            SharedMemoryManager.reset_memories()
+    except BaseException:
+        # Keep the results of completed rounds, but do not let a failure to write
+        # them hide the original error.
+        if unwritten_rounds > 0:
+            try:
+                dump_yaml(data=results, file_path=results_path)
+            except Exception:
+                _logger.exception(f"Failed to write results to {results_path}")
+        raise
+
+    if unwritten_rounds > 0:
+        assert results_path is not None
+        dump_yaml(data=results, file_path=results_path)
 
     if post_function is not None:
         post_function(mgr)
@@ -15,6 +15,9 @@ if TYPE_CHECKING:
 
 _CURRENT_BACKEND: List[Optional[SquidAsmRuntimeManager]] = [None]
 
+# Node names by node ID for the current backend. Cleared when the backend changes.
+_NODE_NAMES: Dict[int, str] = {}
+
 
 def get_running_backend(block: bool = True) -> Optional[SquidAsmRuntimeManager]:
     while True:
@@ -78,9 +81,13 @@ def get_node_id(name: str) -> int:
 
 
 def get_node_name(node_id: int) -> str:
+    node_name = _NODE_NAMES.get(node_id)
+    if node_name is not None:
+        return node_name
     current_node_ids = get_current_node_ids()
     for node_name, tmp_node_id in current_node_ids.items():
         if tmp_node_id == node_id:
+            _NODE_NAMES[node_id] = node_name
             return node_name
     raise ValueError(f"Unknown node with id {node_id}")
 
@@ -90,10 +97,12 @@ def put_current_backend(backend: SquidAsmRuntimeManager) -> None:
         raise RuntimeError("Already a backend running")
     else:
         _CURRENT_BACKEND[0] = backend
+        _NODE_NAMES.clear()
 
 
 def pop_current_backend() -> None:
     _CURRENT_BACKEND[0] = None
+    _NODE_NAMES.clear()
 
 
 class QubitInfo:
@@ -1,6 +1,7 @@
 import logging
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Generator, List, Optional, Set, Tuple, Union
+from typing import Any, Deque, Dict, Generator, List, Optional, Tuple, Union
 
 import netsquid as ns
 from netqasm.lang import operand
@@ -84,38 +85,49 @@ class LogManager:
 
 
 class PortListener(Protocol):
+    """Protocol that buffers all items arriving on a port and signals their arrival.
+
+    Items are stored as they are sent: serialized host messages (`bytes`), but
+    also plain strings and Python objects such as netstack requests.
+    """
+
     def __init__(self, port: Port, signal_label: str) -> None:
-        self._buffer: List[bytes] = []
+        self._buffer: Deque[Any] = deque()
         self._port: Port = port
         self._signal_label = signal_label
         self.add_signal(signal_label)
 
     @property
-    def buffer(self) -> List[bytes]:
+    def buffer(self) -> Deque[Any]:
         return self._buffer
 
+    def _drain(self) -> bool:
+        """Move the items of all inputs currently on the port into the buffer.
+        Items are copied in bulk per input by `deque.extend`.
+
+        :return: whether any input was read
+        """
+        rx_input = self._port.rx_input
+        extend = self._buffer.extend
+        received = False
+        while True:
+            input = rx_input()
+            if input is None:
+                return received
+            extend(input.items)
+            received = True
+
     def run(self) -> Generator[EventExpression, None, None]:
         while True:
             # Wait for an event saying that there is new input.
             yield self.await_port_input(self._port)
 
-            counter = 0
-            # Read all inputs and count them.
-            while True:
-                input = self._port.rx_input()
-                if input is None:
-                    break
-                self._buffer += input.items
-                counter += 1
-            # If there are n inputs, there have been n events, but we yielded only
-            # on one of them so far. "Flush" these n-1 additional events:
-            while counter > 1:
-                yield self.await_port_input(self._port)
-                counter -= 1
-
-            # Only after having yielded on all current events, we can schedule a
-            # notification event, so that its reactor can handle all inputs at once.
-            self.send_signal(self._signal_label)
+            # Read all inputs at once. Inputs that arrived in the same time step
+            # each have their own event; after draining here, those events wake
+            # us up with nothing to read, in which case no signal is sent.
+            # Notify the reactor once, so that it can handle all inputs at once.
+            if self._drain():
+                self.send_signal(self._signal_label)
 
 
 class RegisterMeta:
@@ -150,7 +162,18 @@ class ComponentProtocol(Protocol):
         listener = self._listeners[listener_name]
         if len(listener.buffer) == 0:
             yield self.await_signal(sender=listener, signal_label=wake_up_signal)
-        return listener.buffer.pop(0)
+        return listener.buffer.popleft()
+
+    def _receive_all(
+        self, listener_name: str, wake_up_signal: str
+    ) -> Generator[EventExpression, None, List[str]]:
+        """Receive all buffered messages at once. Only yields if there are none."""
+        listener = self._listeners[listener_name]
+        if len(listener.buffer) == 0:
+            yield self.await_signal(sender=listener, signal_label=wake_up_signal)
+        msgs = list(listener.buffer)
+        listener.buffer.clear()
+        return msgs
 
     def start(self) -> None:
         super().start()
@@ -274,6 +297,22 @@ class AppMemory:
         )
         self._arrays[address, index] = value
 
+    def set_array_values(
+        self, addr: int, start_offset: int, values: List[Optional[int]]
+    ) -> None:
+        """Write `values` to consecutive elements of an array, starting at
+        `start_offset`, in a single slice assignment."""
+        end_offset = start_offset + len(values)
+        # A slice past the end of the array is shorter than `values`; writing it
+        # would grow the array instead of failing.
+        current = self._arrays[addr, slice(start_offset, end_offset)]
+        if current is None or len(current) != len(values):
+            raise IndexError(
+                f"Cannot write to @{addr}[{start_offset}:{end_offset}]: "
+                f"out of range for the array"
+            )
+        self._arrays[addr, slice(start_offset, end_offset)] = values
+
     def get_array_slice(
         self, array_slice: operand.ArraySlice
     ) -> Optional[List[Optional[int]]]:
@@ -324,8 +363,21 @@ class AppMemory:
         return address, index
 
 
+# Netstack requests are created for every entanglement request and declare
+# `__slots__` explicitly, since `dataclass(slots=True)` requires Python 3.10.
+
+
 @dataclass
 class NetstackCreateRequest:
+    __slots__ = (
+        "app_id",
+        "remote_node_id",
+        "epr_socket_id",
+        "qubit_array_addr",
+        "arg_array_addr",
+        "result_array_addr",
+    )
+
     app_id: int
     remote_node_id: int
     epr_socket_id: int
@@ -336,6 +388,14 @@ class NetstackCreateRequest:
 
 @dataclass
 class NetstackReceiveRequest:
+    __slots__ = (
+        "app_id",
+        "remote_node_id",
+        "epr_socket_id",
+        "qubit_array_addr",
+        "result_array_addr",
+    )
+
     app_id: int
     remote_node_id: int
     epr_socket_id: int
@@ -345,11 +405,15 @@ class NetstackReceiveRequest:
 
 @dataclass
 class NetstackBreakpointCreateRequest:
+    __slots__ = ("app_id",)
+
     app_id: int
 
 
 @dataclass
 class NetstackBreakpointReceiveRequest:
+    __slots__ = ("app_id",)
+
     app_id: int
 
 
@@ -360,8 +424,10 @@ class AllocError(Exception):
 class PhysicalQuantumMemory:
     def __init__(self, qubit_count: int) -> None:
         self._qubit_count = qubit_count
-        self._allocated_ids: Set[int] = set()
-        self._comm_qubit_ids: Set[int] = {i for i in range(qubit_count)}
+        # Bit i of a mask is set iff qubit i belongs to the set the mask describes.
+        self._free_mask: int = (1 << qubit_count) - 1
+        self._comm_mask: int = self._free_mask
+        self._mem_mask: int = 0
 
     @property
     def qubit_count(self) -> int:
@@ -369,43 +435,64 @@ class PhysicalQuantumMemory:
 
     @property
     def comm_qubit_count(self) -> int:
-        return len(self._comm_qubit_ids)
+        return bin(self._comm_mask).count("1")
+
+    def _take_lowest(self, candidates: int) -> Optional[int]:
+        """Allocate the lowest qubit whose bit is set in `candidates`, which must be a
+        subset of the free qubits. Return None if there is none."""
+        # `mask & -mask` isolates the lowest set bit; its bit length minus one is
+        # the qubit ID.
+        lsb = candidates & -candidates
+        if not lsb:
+            return None
+        self._free_mask ^= lsb
+        return lsb.bit_length() - 1
 
     def allocate(self) -> int:
         """Allocate a qubit (communcation or memory)."""
-        for i in range(self._qubit_count):
-            if i not in self._allocated_ids:
-                self._allocated_ids.add(i)
-                return i
-        raise AllocError("No more qubits available")
+        phys_id = self._take_lowest(self._free_mask)
+        if phys_id is None:
+            raise AllocError("No more qubits available")
+        return phys_id
 
     def allocate_comm(self) -> int:
         """Allocate a communication qubit."""
-        for i in range(self._qubit_count):
-            if i not in self._allocated_ids and i in self._comm_qubit_ids:
-                self._allocated_ids.add(i)
-                return i
-        raise AllocError("No more comm qubits available")
+        phys_id = self.try_allocate_comm()
+        if phys_id is None:
+            raise AllocError("No more comm qubits available")
+        return phys_id
+
+    def try_allocate_comm(self) -> Optional[int]:
+        """Allocate a communication qubit, or return None if none is free."""
+        return self._take_lowest(self._free_mask & self._comm_mask)
 
     def allocate_mem(self) -> int:
         """Allocate a memory qubit."""
-        for i in range(self._qubit_count):
-            if i not in self._allocated_ids and i not in self._comm_qubit_ids:
-                self._allocated_ids.add(i)
-                return i
-        raise AllocError("No more mem qubits available")
+        phys_id = self._take_lowest(self._free_mask & self._mem_mask)
+        if phys_id is None:
+            raise AllocError("No more mem qubits available")
+        return phys_id
 
     def free(self, id: int) -> None:
-        self._allocated_ids.remove(id)
+        if not 0 <= id < self._qubit_count:
+            raise AllocError(f"Cannot free qubit {id}: no such qubit")
+        bit = 1 << id
+        if self._free_mask & bit:
+            raise AllocError(f"Cannot free qubit {id}: it is not allocated")
+        self._free_mask |= bit
 
     def is_allocated(self, id: int) -> bool:
-        return id in self._allocated_ids
+        if not 0 <= id < self._qubit_count:
+            return False
+        return not (self._free_mask >> id) & 1
 
     def clear(self) -> None:
-        self._allocated_ids = {}
+        self._free_mask = (1 << self._qubit_count) - 1
 
 
 class NVPhysicalQuantumMemory(PhysicalQuantumMemory):
     def __init__(self, qubit_count: int) -> None:
         super().__init__(qubit_count)
-        self._comm_qubit_ids: Set[int] = {0}
+        # Only qubit 0 (the electron) is a communication qubit.
+        self._comm_mask = 1
+        self._mem_mask = ((1 << qubit_count) - 1) & ~self._comm_mask
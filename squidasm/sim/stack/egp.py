@@ -64,15 +64,18 @@ class EgpProtocol(EGPService):
         self._ll_prot = magic_link_layer_protocol
 
     def run(self):
+        # The node and link layer protocol do not change while running, so
+        # resolve them, and the methods called for each response, only once.
+        ll_prot = self._ll_prot
+        node_id = self.node.ID
+        label = "react_to_{}".format(node_id)
+        await_signal = self.await_signal
+        get_signal_result = ll_prot.get_signal_result
+        send_response = self.send_response
         while True:
-            yield self.await_signal(
-                sender=self._ll_prot,
-                signal_label="react_to_{}".format(self.node.ID),
-            )
-            result = self._ll_prot.get_signal_result(
-                label="react_to_{}".format(self.node.ID), receiver=self
-            )
-            if result.node_id == self.node.ID:
+            yield await_signal(sender=ll_prot, signal_label=label)
+            result = get_signal_result(label=label, receiver=self)
+            if result.node_id == node_id:
                 try:
                     BellIndex(result.msg.bell_state)
                 except AttributeError:
@@ -82,7 +85,7 @@ class EgpProtocol(EGPService):
                         f"{result.msg.bell_state}, which was obtained from magic link layer protocol,"
                         f"is not a :class:`netsquid.qubits.ketstates.BellIndex`."
                     )
-                self.send_response(response=result.msg)
+                send_response(response=result.msg)
 
     def create_and_keep(self, req):
         super().create_and_keep(req)
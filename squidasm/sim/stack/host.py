@@ -114,6 +114,12 @@ class Host(ComponentProtocol):
     def run(self) -> Generator[EventExpression, None, None]:
         """Run this protocol. Automatically called by NetSquid during simulation."""
 
+        # Node names and IDs do not change during the simulation, so map remote
+        # node names to their IDs once instead of for each socket in each run.
+        node_ids: Dict[str, int] = {
+            name: id for id, name in NetSquidContext.get_nodes().items()
+        }
+
         # Run a single program as many times as requested.
         while self._num_pending > 0:
             self._logger.info(f"num pending: {self._num_pending}")
@@ -141,11 +147,7 @@ class Host(ComponentProtocol):
             # Create EPR sockets that can be used by the program SDK code.
             epr_sockets: Dict[int, EPRSocket] = {}
             for i, remote_name in enumerate(prog_meta.epr_sockets):
-                remote_id = None
-                nodes = NetSquidContext.get_nodes()
-                for id, name in nodes.items():
-                    if name == remote_name:
-                        remote_id = id
+                remote_id = node_ids.get(remote_name)
                 assert remote_id is not None
                 self.send_qnos_msg(bytes(OpenEPRSocketMessage(app_id, i, remote_id)))
                 epr_sockets[remote_name] = EPRSocket(remote_name, i)
@@ -154,12 +156,7 @@ class Host(ComponentProtocol):
             # Create classical sockets that can be used by the program SDK code.
             classical_sockets: Dict[int, ClassicalSocket] = {}
             for i, remote_name in enumerate(prog_meta.csockets):
-                remote_id = None
-                nodes = NetSquidContext.get_nodes()
-                for id, name in nodes.items():
-                    if name == remote_name:
-                        remote_id = id
-                assert remote_id is not None
+                assert remote_name in node_ids
                 classical_sockets[remote_name] = ClassicalSocket(
                     self, prog_meta.name, remote_name
                 )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import logging
 import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Generator, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Generator, List, Optional, Tuple, Type
 
 import netsquid as ns
 from netqasm.sdk.build_epr import (
@@ -35,7 +36,6 @@ from qlink_interface.interface import ReqRemoteStatePrep
 
 from pydynaa import EventExpression
 from squidasm.sim.stack.common import (
-    AllocError,
     AppMemory,
     ComponentProtocol,
     NetstackBreakpointCreateRequest,
@@ -58,6 +58,18 @@ if TYPE_CHECKING:
 PI = math.pi
 PI_OVER_2 = math.pi / 2
 
+# Labels of the signals the EGP sends when a create-and-keep or measure-directly
+# pair is delivered.
+SIGNAL_EGP_RES_CK = ResCreateAndKeep.__name__
+SIGNAL_EGP_RES_MD = ResMeasureDirectly.__name__
+
+# Link layer request type for each create type in a NetQASM create arguments array.
+_CREATE_REQUEST_TYPES: Dict[int, Type[ReqCreateBase]] = {
+    0: ReqCreateAndKeep,
+    1: ReqMeasureDirectly,
+    2: ReqRemoteStatePrep,
+}
+
 
 class NetstackComponent(Component):
     """NetSquid component representing the network stack in QNodeOS.
@@ -138,6 +150,57 @@ class Netstack(ComponentProtocol):
 
         self._egp: Optional[EgpProtocol] = None
         self._epr_sockets: Dict[int, List[EprSocket]] = {}  # app ID -> [socket]
+        # (app ID, socket ID, remote ID) -> socket, for fast lookup of sockets
+        self._epr_sockets_by_key: Dict[Tuple[int, int, int], EprSocket] = {}
+
+        # Receive requests only depend on the remote node, and are not modified by
+        # the EGP, so a single instance per remote node is reused.
+        self._receive_requests: Dict[int, ReqReceive] = {}  # remote ID -> request
+
+        # Programs that correct a delivered pair to Phi+ (i.e. B00), by Bell index.
+        # These do not depend on the pair, so they are only built once.
+        self._bell_correction_progs: Dict[BellIndex, QuantumProgram] = {}
+        prog = QuantumProgram()
+        prog.apply(INSTR_ROT_X, qubit_indices=[0], angle=PI)
+        self._bell_correction_progs[BellIndex.B01] = prog
+        prog = QuantumProgram()
+        prog.apply(INSTR_ROT_Z, qubit_indices=[0], angle=PI)
+        self._bell_correction_progs[BellIndex.B10] = prog
+        prog = QuantumProgram()
+        prog.apply(INSTR_ROT_X, qubit_indices=[0], angle=PI)
+        prog.apply(INSTR_ROT_Z, qubit_indices=[0], angle=PI)
+        self._bell_correction_progs[BellIndex.B11] = prog
+
+        # Handlers per link layer request type, for the initiator and the receiver.
+        # Requests are built from _CREATE_REQUEST_TYPES, so their exact type is used.
+        self._create_handlers: Dict[
+            Type[ReqCreateBase], Callable[..., Generator[EventExpression, None, None]]
+        ] = {
+            ReqCreateAndKeep: self.handle_create_ck_request,
+            ReqMeasureDirectly: self.handle_create_md_request,
+        }
+        self._receive_handlers: Dict[
+            Type[ReqCreateBase], Callable[..., Generator[EventExpression, None, None]]
+        ] = {
+            ReqCreateAndKeep: self.handle_receive_ck_request,
+            ReqMeasureDirectly: self.handle_receive_md_request,
+        }
+
+        # Handler and description per type of message from the processor.
+        self._processor_msg_handlers: Dict[
+            type, Tuple[Callable[..., Generator[EventExpression, None, None]], str]
+        ] = {
+            NetstackCreateRequest: (self.handle_create_request, "create request"),
+            NetstackReceiveRequest: (self.handle_receive_request, "receive request"),
+            NetstackBreakpointCreateRequest: (
+                lambda _: self.handle_breakpoint_create_request(),
+                "breakpoint create request",
+            ),
+            NetstackBreakpointReceiveRequest: (
+                lambda _: self.handle_breakpoint_receive_request(),
+                "breakpoint receive request",
+            ),
+        }
 
     def assign_ll_protocol(self, prot: MagicLinkLayerProtocolWithSignaling) -> None:
         """Set the magic link layer protocol that this network stack uses to produce
@@ -156,7 +219,11 @@ class Netstack(ComponentProtocol):
         """
         if app_id not in self._epr_sockets:
             self._epr_sockets[app_id] = []
-        self._epr_sockets[app_id].append(EprSocket(socket_id, remote_node_id))
+        socket = EprSocket(socket_id, remote_node_id)
+        self._epr_sockets[app_id].append(socket)
+        key = (app_id, socket_id, remote_node_id)
+        # Keep the first matching socket, as a scan over the list would.
+        self._epr_sockets_by_key.setdefault(key, socket)
 
     def _send_processor_msg(self, msg: str) -> None:
         """Send a message to the processor."""
@@ -194,6 +261,14 @@ class Netstack(ComponentProtocol):
             self._egp.stop()
         super().stop()
 
+    def _get_receive_request(self, remote_node_id: int) -> ReqReceive:
+        """Get the link layer receive request for the given remote node."""
+        request = self._receive_requests.get(remote_node_id)
+        if request is None:
+            request = ReqReceive(remote_node_id=remote_node_id)
+            self._receive_requests[remote_node_id] = request
+        return request
+
     def _read_request_args_array(self, app_id: int, array_addr: int) -> List[int]:
         app_mem = self.app_memories[app_id]
         app_mem.get_array(array_addr)
@@ -215,27 +290,14 @@ class Netstack(ComponentProtocol):
         # TODO
         MINIMUM_FIDELITY = 0.99
 
-        if typ == 0:
-            request = ReqCreateAndKeep(
-                remote_node_id=remote_id,
-                number=num_pairs,
-                minimum_fidelity=MINIMUM_FIDELITY,
-            )
-        elif typ == 1:
-            request = ReqMeasureDirectly(
-                remote_node_id=remote_id,
-                number=num_pairs,
-                minimum_fidelity=MINIMUM_FIDELITY,
-            )
-        elif typ == 2:
-            request = ReqRemoteStatePrep(
-                remote_node_id=remote_id,
-                number=num_pairs,
-                minimum_fidelity=MINIMUM_FIDELITY,
-            )
-        else:
+        request_type = _CREATE_REQUEST_TYPES.get(typ)
+        if request_type is None:
             raise ValueError(f"Unsupported create type {typ}")
-        return request
+        return request_type(
+            remote_node_id=remote_id,
+            number=num_pairs,
+            minimum_fidelity=MINIMUM_FIDELITY,
+        )
 
     @property
     def app_memories(self) -> Dict[int, AppMemory]:
@@ -259,12 +321,7 @@ class Netstack(ComponentProtocol):
         :param rem_id: remote node ID
         :return: the corresponding EPR socket or None if it does not exist
         """
-        if app_id not in self._epr_sockets:
-            return None
-        for sck in self._epr_sockets[app_id]:
-            if sck.socket_id == sck_id and sck.remote_id == rem_id:
-                return sck
-        return None
+        return self._epr_sockets_by_key.get((app_id, sck_id, rem_id))
 
     def handle_create_ck_request(
         self, req: NetstackCreateRequest, request: ReqCreateAndKeep
@@ -295,7 +352,14 @@ class Netstack(ComponentProtocol):
         """
         num_pairs = request.number
 
+        # These do not change while handling the request.
+        egp = self._egp
+        physical_memory = self.physical_memory
         app_mem = self.app_memories[req.app_id]
+        # Avoid formatting per-pair log messages that would be dropped anyway.
+        info_enabled = self._logger.isEnabledFor(logging.INFO)
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+
         qubit_ids = app_mem.get_array(req.qubit_array_addr)
 
         self._logger.info(f"putting CK request to EGP for {num_pairs} pairs")
@@ -303,96 +367,88 @@ class Netstack(ComponentProtocol):
         self._logger.info(f"splitting request into {num_pairs} 1-pair requests")
         request.number = 1
 
+        # Length of response array slice for a single pair.
+        slice_len = SER_RESPONSE_KEEP_LEN
+        # Indices within a slice, bound locally for the per-pair loop.
+        idx_goodness = SER_RESPONSE_KEEP_IDX_GOODNESS
+        idx_bell_state = SER_RESPONSE_KEEP_IDX_BELL_STATE
+        # Response array slice, written for each pair. Unused elements are -1.
+        slice_values = [-1] * slice_len
+
+        # Bell state corrections are skipped for heralded links as a hotfix, as it was
+        # found that the heralded link did not return the Phi+ bell state. The issue
+        # needs to be investigated.
+        correct_bell_state = not isinstance(
+            egp._ll_prot._magic_distributor, DoubleClickMagicDistributor
+        )
+
         start_time = ns.sim_time()
 
         for pair_index in range(num_pairs):
-            self._logger.info(f"trying to allocate comm qubit for pair {pair_index}")
-            while True:
-                try:
-                    phys_id = self.physical_memory.allocate_comm()
-                    break
-                except AllocError:
-                    self._logger.info("no comm qubit available, waiting...")
-
-                    # Wait for a signal indicating the communication qubit might be free
-                    # again.
-                    yield self.await_signal(
-                        sender=self._qnos.processor, signal_label=SIGNAL_MEMORY_FREED
-                    )
-                    self._logger.info(
-                        "a 'free' happened, trying again to allocate comm qubit..."
-                    )
+            if info_enabled:
+                self._logger.info(
+                    f"trying to allocate comm qubit for pair {pair_index}"
+                )
+            phys_id = physical_memory.try_allocate_comm()
+            while phys_id is None:
+                self._logger.info("no comm qubit available, waiting...")
+
+                # Wait for a signal indicating the communication qubit might be free
+                # again.
+                yield self.await_signal(
+                    sender=self._qnos.processor, signal_label=SIGNAL_MEMORY_FREED
+                )
+                self._logger.info(
+                    "a 'free' happened, trying again to allocate comm qubit..."
+                )
+                phys_id = physical_memory.try_allocate_comm()
 
             # Put the request to the EGP.
-            self._logger.info(f"putting CK request for pair {pair_index}")
-            self._egp.put(request)
+            if info_enabled:
+                self._logger.info(f"putting CK request for pair {pair_index}")
+            egp.put(request)
 
             # Wait for a signal from the EGP.
-            self._logger.info(f"waiting for result for pair {pair_index}")
-            yield self.await_signal(
-                sender=self._egp, signal_label=ResCreateAndKeep.__name__
-            )
+            if info_enabled:
+                self._logger.info(f"waiting for result for pair {pair_index}")
+            yield self.await_signal(sender=egp, signal_label=SIGNAL_EGP_RES_CK)
             # Get the EGP's result.
-            result: ResCreateAndKeep = self._egp.get_signal_result(
-                ResCreateAndKeep.__name__, receiver=self
+            result: ResCreateAndKeep = egp.get_signal_result(
+                SIGNAL_EGP_RES_CK, receiver=self
             )
-            self._logger.info(f"got result for pair {pair_index}: {result}")
-
-            # This code is commented out for a hotfix as it was found that heralded link did not return
-            # Phi+ bell state. The issue needs to be investigated.
-            if isinstance(
-                self._egp._ll_prot._magic_distributor, DoubleClickMagicDistributor
-            ):
-                pass
-            # Bell state corrections. Resulting state is always Phi+ (i.e. B00).
-            elif result.bell_state == BellIndex.B00:
-                pass
-            elif result.bell_state == BellIndex.B01:
-                prog = QuantumProgram()
-                prog.apply(INSTR_ROT_X, qubit_indices=[0], angle=PI)
-                yield self.qdevice.execute_program(prog)
-            elif result.bell_state == BellIndex.B10:
-                prog = QuantumProgram()
-                prog.apply(INSTR_ROT_Z, qubit_indices=[0], angle=PI)
-                yield self.qdevice.execute_program(prog)
-            elif result.bell_state == BellIndex.B11:
-                prog = QuantumProgram()
-                prog.apply(INSTR_ROT_X, qubit_indices=[0], angle=PI)
-                prog.apply(INSTR_ROT_Z, qubit_indices=[0], angle=PI)
-                yield self.qdevice.execute_program(prog)
+            if info_enabled:
+                self._logger.info(f"got result for pair {pair_index}: {result}")
+
+            if correct_bell_state:
+                # Bell state corrections. Resulting state is always Phi+ (i.e. B00).
+                prog = self._bell_correction_progs.get(result.bell_state)
+                if prog is not None:
+                    yield self.qdevice.execute_program(prog)
 
             virt_id = app_mem.get_array_value(req.qubit_array_addr, pair_index)
             app_mem.map_virt_id(virt_id, phys_id)
-            self._logger.info(
-                f"mapping virtual qubit {virt_id} to physical qubit {phys_id}"
-            )
+            if info_enabled:
+                self._logger.info(
+                    f"mapping virtual qubit {virt_id} to physical qubit {phys_id}"
+                )
 
             gen_duration_ns_float = ns.sim_time() - start_time
             gen_duration_us_int = int(gen_duration_ns_float / 1000)
-            self._logger.info(f"gen duration (us): {gen_duration_us_int}")
-
-            # Length of response array slice for a single pair.
-            slice_len = SER_RESPONSE_KEEP_LEN
+            if info_enabled:
+                self._logger.info(f"gen duration (us): {gen_duration_us_int}")
 
             # Populate results array.
-            for i in range(slice_len):
-                # Write -1 to unused array elements.
-                value = -1
-
-                # Write corresponding result value to the other array elements.
-                if i == SER_RESPONSE_KEEP_IDX_GOODNESS:
-                    value = gen_duration_us_int
-                if i == SER_RESPONSE_KEEP_IDX_BELL_STATE:
-                    value = result.bell_state
-
-                # Calculate array element location.
-                arr_index = slice_len * pair_index + i
-
-                app_mem.set_array_value(req.result_array_addr, arr_index, value)
-            self._logger.debug(
-                f"wrote to @{req.result_array_addr}[{slice_len * pair_index}:"
-                f"{slice_len * pair_index + slice_len}] for app ID {req.app_id}"
-            )
+            offset = slice_len * pair_index
+            slice_values[idx_goodness] = gen_duration_us_int
+            slice_values[idx_bell_state] = result.bell_state
+            app_mem.set_array_values(req.result_array_addr, offset, slice_values)
+            if debug_enabled:
+                self._logger.debug(
+                    f"wrote to @{req.result_array_addr}[{offset}:{offset + slice_len}] "
+                    f"for app ID {req.app_id}"
+                )
+            # Notify per pair: the processor may be waiting on this pair's slice
+            # before it can free the comm qubit needed for the next pair.
             self._send_processor_msg("wrote to array")
 
     def handle_create_md_request(
@@ -422,54 +478,54 @@ class Netstack(ComponentProtocol):
         :param request: link layer request object
         """
 
-        # Put the reqeust to the EGP.
-        self._egp.put(request)
-
-        results: List[ResMeasureDirectly] = []
-
-        # Wait for all pairs to be created. For each pair, the EGP sends a separate
-        # signal that is awaited here. Only after the last pair, we write the results
-        # to the array. This is done since the whole request (i.e. all pairs) is
-        # expected to finish in a short time anyway. However, writing results for a
-        # pair as soon as they are done may be implemented in the future.
-        for _ in range(request.number):
-            phys_id = self.physical_memory.allocate_comm()
+        # These do not change while handling the request.
+        egp = self._egp
+        physical_memory = self.physical_memory
+        # Avoid formatting per-pair log messages that would be dropped anyway.
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
 
-            yield self.await_signal(
-                sender=self._egp, signal_label=ResMeasureDirectly.__name__
-            )
-            result: ResMeasureDirectly = self._egp.get_signal_result(
-                ResMeasureDirectly.__name__, receiver=self
-            )
-            self._logger.debug(f"bell index: {result.bell_state}")
-            results.append(result)
-            self.physical_memory.free(phys_id)
+        # Put the reqeust to the EGP.
+        egp.put(request)
 
         app_mem = self.app_memories[req.app_id]
 
         # Length of response array slice for a single pair.
         slice_len = SER_RESPONSE_MEASURE_LEN
+        # Indices within a slice, bound locally for the pair loop.
+        idx_outcome = SER_RESPONSE_MEASURE_IDX_MEASUREMENT_OUTCOME
+        idx_basis = SER_RESPONSE_MEASURE_IDX_MEASUREMENT_BASIS
+        idx_bell_state = SER_RESPONSE_KEEP_IDX_BELL_STATE
+        # Response array values for all pairs. Unused elements are -1.
+        values = [-1] * (slice_len * request.number)
+        # Offset of the current pair's slice in `values`.
+        offset = 0
 
-        # Populate results array.
-        for pair_index in range(request.number):
-            result = results[pair_index]
-
-            for i in range(slice_len):
-                # Write -1 to unused array elements.
-                value = -1
-
-                # Write corresponding result value to the other array elements.
-                if i == SER_RESPONSE_MEASURE_IDX_MEASUREMENT_OUTCOME:
-                    value = result.measurement_outcome
-                elif i == SER_RESPONSE_MEASURE_IDX_MEASUREMENT_BASIS:
-                    value = result.measurement_basis.value
-                elif i == SER_RESPONSE_KEEP_IDX_BELL_STATE:
-                    value = result.bell_state.value
+        # Wait for all pairs to be created. For each pair, the EGP sends a separate
+        # signal that is awaited here. The results of each pair are stored as soon as
+        # it arrives, but they are only written to the array after the last pair.
+        # This is done since the whole request (i.e. all pairs) is expected to finish
+        # in a short time anyway. However, writing results for a pair as soon as they
+        # are done may be implemented in the future.
+        #
+        # A communication qubit is in use while a pair is generated. It is held for
+        # the whole request, since nothing can happen between freeing it after one
+        # pair and allocating it again for the next one.
+        phys_id = physical_memory.allocate_comm()
 
-                # Calculate array element location.
-                arr_index = slice_len * pair_index + i
+        for _ in range(request.number):
+            yield self.await_signal(sender=egp, signal_label=SIGNAL_EGP_RES_MD)
+            result: ResMeasureDirectly = egp.get_signal_result(
+                SIGNAL_EGP_RES_MD, receiver=self
+            )
+            if debug_enabled:
+                self._logger.debug(f"bell index: {result.bell_state}")
+            values[offset + idx_outcome] = result.measurement_outcome
+            values[offset + idx_basis] = result.measurement_basis.value
+            values[offset + idx_bell_state] = result.bell_state.value
+            offset += slice_len
+        physical_memory.free(phys_id)
 
-                app_mem.set_array_value(req.result_array_addr, arr_index, value)
+        app_mem.set_array_values(req.result_array_addr, 0, values)
 
         self._send_processor_msg("wrote to array")
 
@@ -496,13 +552,13 @@ class Netstack(ComponentProtocol):
         # Send it to the receiver node and wait for an acknowledgement.
         self._send_peer_msg(request)
         peer_msg = yield from self._receive_peer_msg()
-        self._logger.debug(f"received peer msg: {peer_msg}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"received peer msg: {peer_msg}")
 
         # Handle the request.
-        if isinstance(request, ReqCreateAndKeep):
-            yield from self.handle_create_ck_request(req, request)
-        elif isinstance(request, ReqMeasureDirectly):
-            yield from self.handle_create_md_request(req, request)
+        handler = self._create_handlers.get(type(request))
+        if handler is not None:
+            yield from handler(req, request)
 
     def handle_receive_ck_request(
         self, req: NetstackReceiveRequest, request: ReqCreateAndKeep
@@ -538,73 +594,84 @@ class Netstack(ComponentProtocol):
         self._logger.info(f"putting CK request to EGP for {num_pairs} pairs")
         self._logger.info(f"splitting request into {num_pairs} 1-pair requests")
 
+        # These do not change while handling the request.
+        egp = self._egp
+        physical_memory = self.physical_memory
+        app_mem = self.app_memories[req.app_id]
+        # Avoid formatting per-pair log messages that would be dropped anyway.
+        info_enabled = self._logger.isEnabledFor(logging.INFO)
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        receive_request = self._get_receive_request(req.remote_node_id)
+
+        # Length of response array slice for a single pair.
+        slice_len = SER_RESPONSE_KEEP_LEN
+        # Indices within a slice, bound locally for the per-pair loop.
+        idx_goodness = SER_RESPONSE_KEEP_IDX_GOODNESS
+        idx_bell_state = SER_RESPONSE_KEEP_IDX_BELL_STATE
+        # Response array slice, written for each pair. Unused elements are -1.
+        slice_values = [-1] * slice_len
+
         start_time = ns.sim_time()
 
         for pair_index in range(num_pairs):
-            self._logger.info(f"trying to allocate comm qubit for pair {pair_index}")
-            while True:
-                try:
-                    phys_id = self.physical_memory.allocate_comm()
-                    break
-                except AllocError:
-                    self._logger.info("no comm qubit available, waiting...")
-
-                    # Wait for a signal indicating the communication qubit might be free
-                    # again.
-                    yield self.await_signal(
-                        sender=self._qnos.processor, signal_label=SIGNAL_MEMORY_FREED
-                    )
-                    self._logger.info(
-                        "a 'free' happened, trying again to allocate comm qubit..."
-                    )
+            if info_enabled:
+                self._logger.info(
+                    f"trying to allocate comm qubit for pair {pair_index}"
+                )
+            phys_id = physical_memory.try_allocate_comm()
+            while phys_id is None:
+                self._logger.info("no comm qubit available, waiting...")
+
+                # Wait for a signal indicating the communication qubit might be free
+                # again.
+                yield self.await_signal(
+                    sender=self._qnos.processor, signal_label=SIGNAL_MEMORY_FREED
+                )
+                self._logger.info(
+                    "a 'free' happened, trying again to allocate comm qubit..."
+                )
+                phys_id = physical_memory.try_allocate_comm()
 
             # Put the request to the EGP.
-            self._logger.info(f"putting CK request for pair {pair_index}")
-            self._egp.put(ReqReceive(remote_node_id=req.remote_node_id))
-            self._logger.info(f"waiting for result for pair {pair_index}")
+            if info_enabled:
+                self._logger.info(f"putting CK request for pair {pair_index}")
+            egp.put(receive_request)
+            if info_enabled:
+                self._logger.info(f"waiting for result for pair {pair_index}")
 
             # Wait for a signal from the EGP.
-            yield self.await_signal(
-                sender=self._egp, signal_label=ResCreateAndKeep.__name__
-            )
+            yield self.await_signal(sender=egp, signal_label=SIGNAL_EGP_RES_CK)
             # Get the EGP's result.
-            result: ResCreateAndKeep = self._egp.get_signal_result(
-                ResCreateAndKeep.__name__, receiver=self
+            result: ResCreateAndKeep = egp.get_signal_result(
+                SIGNAL_EGP_RES_CK, receiver=self
             )
-            self._logger.info(f"got result for pair {pair_index}: {result}")
+            if info_enabled:
+                self._logger.info(f"got result for pair {pair_index}: {result}")
 
-            app_mem = self.app_memories[req.app_id]
             virt_id = app_mem.get_array_value(req.qubit_array_addr, pair_index)
             app_mem.map_virt_id(virt_id, phys_id)
-            self._logger.info(
-                f"mapping virtual qubit {virt_id} to physical qubit {phys_id}"
-            )
+            if info_enabled:
+                self._logger.info(
+                    f"mapping virtual qubit {virt_id} to physical qubit {phys_id}"
+                )
 
             gen_duration_ns_float = ns.sim_time() - start_time
             gen_duration_us_int = int(gen_duration_ns_float / 1000)
-            self._logger.info(f"gen duration (us): {gen_duration_us_int}")
-
-            # Length of response array slice for a single pair.
-            slice_len = SER_RESPONSE_KEEP_LEN
-
-            for i in range(slice_len):
-                # Write -1 to unused array elements.
-                value = -1
-
-                # Write corresponding result value to the other array elements.
-                if i == SER_RESPONSE_KEEP_IDX_GOODNESS:
-                    value = gen_duration_us_int
-                if i == SER_RESPONSE_KEEP_IDX_BELL_STATE:
-                    value = result.bell_state.value
+            if info_enabled:
+                self._logger.info(f"gen duration (us): {gen_duration_us_int}")
 
-                # Calculate array element location.
-                arr_index = slice_len * pair_index + i
-
-                app_mem.set_array_value(req.result_array_addr, arr_index, value)
-            self._logger.debug(
-                f"wrote to @{req.result_array_addr}[{slice_len * pair_index}:"
-                f"{slice_len * pair_index + slice_len}] for app ID {req.app_id}"
-            )
+            # Populate results array.
+            offset = slice_len * pair_index
+            slice_values[idx_goodness] = gen_duration_us_int
+            slice_values[idx_bell_state] = result.bell_state.value
+            app_mem.set_array_values(req.result_array_addr, offset, slice_values)
+            if debug_enabled:
+                self._logger.debug(
+                    f"wrote to @{req.result_array_addr}[{offset}:{offset + slice_len}] "
+                    f"for app ID {req.app_id}"
+                )
+            # Notify per pair: the processor may be waiting on this pair's slice
+            # before it can free the comm qubit needed for the next pair.
             self._send_processor_msg("wrote to array")
 
     def handle_receive_md_request(
@@ -636,50 +703,44 @@ class Netstack(ComponentProtocol):
         """
         assert isinstance(request, ReqMeasureDirectly)
 
-        self._egp.put(ReqReceive(remote_node_id=req.remote_node_id))
+        # These do not change while handling the request.
+        egp = self._egp
+        physical_memory = self.physical_memory
 
-        results: List[ResMeasureDirectly] = []
-
-        for _ in range(request.number):
-            phys_id = self.physical_memory.allocate_comm()
-
-            yield self.await_signal(
-                sender=self._egp, signal_label=ResMeasureDirectly.__name__
-            )
-            result: ResMeasureDirectly = self._egp.get_signal_result(
-                ResMeasureDirectly.__name__, receiver=self
-            )
-            results.append(result)
-
-            self.physical_memory.free(phys_id)
+        egp.put(self._get_receive_request(req.remote_node_id))
 
         app_mem = self.app_memories[req.app_id]
 
         # Length of response array slice for a single pair.
         slice_len = SER_RESPONSE_MEASURE_LEN
+        # Indices within a slice, bound locally for the pair loop.
+        idx_outcome = SER_RESPONSE_MEASURE_IDX_MEASUREMENT_OUTCOME
+        idx_basis = SER_RESPONSE_MEASURE_IDX_MEASUREMENT_BASIS
+        idx_bell_state = SER_RESPONSE_KEEP_IDX_BELL_STATE
+        # Response array values for all pairs. Unused elements are -1.
+        values = [-1] * (slice_len * request.number)
+        # Offset of the current pair's slice in `values`.
+        offset = 0
+
+        # A communication qubit is in use while a pair is generated. It is held for
+        # the whole request, since nothing can happen between freeing it after one
+        # pair and allocating it again for the next one.
+        phys_id = physical_memory.allocate_comm()
+        for _ in range(request.number):
+            yield self.await_signal(sender=egp, signal_label=SIGNAL_EGP_RES_MD)
+            result: ResMeasureDirectly = egp.get_signal_result(
+                SIGNAL_EGP_RES_MD, receiver=self
+            )
+            values[offset + idx_outcome] = result.measurement_outcome
+            values[offset + idx_basis] = result.measurement_basis.value
+            values[offset + idx_bell_state] = result.bell_state.value
+            offset += slice_len
+        physical_memory.free(phys_id)
 
-        # Populate results array.
-        for pair_index in range(request.number):
-            result = results[pair_index]
-
-            for i in range(slice_len):
-                # Write -1 to unused array elements.
-                value = -1
-
-                # Write corresponding result value to the other array elements.
-                if i == SER_RESPONSE_MEASURE_IDX_MEASUREMENT_OUTCOME:
-                    value = result.measurement_outcome
-                elif i == SER_RESPONSE_MEASURE_IDX_MEASUREMENT_BASIS:
-                    value = result.measurement_basis.value
-                elif i == SER_RESPONSE_KEEP_IDX_BELL_STATE:
-                    value = result.bell_state.value
-
-                # Calculate array element location.
-                arr_index = slice_len * pair_index + i
-
-                app_mem.set_array_value(req.result_array_addr, arr_index, value)
+        app_mem.set_array_values(req.result_array_addr, 0, values)
 
-            self._send_processor_msg("wrote to array")
+        # All pairs are written at once, so a single notification is enough.
+        self._send_processor_msg("wrote to array")
 
     def handle_receive_request(
         self, req: NetstackReceiveRequest
@@ -702,7 +763,8 @@ class Netstack(ComponentProtocol):
         # and then fully handle the request. There is no support for queueing
         # and/or interleaving multiple different requests.
         create_request = yield from self._receive_peer_msg()
-        self._logger.debug(f"received {create_request} from peer")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"received {create_request} from peer")
 
         # Acknowledge to the remote node that we received the request and we will
         # start handling it.
@@ -711,10 +773,9 @@ class Netstack(ComponentProtocol):
 
         # Handle the request, based on the type that we now know because of the
         # other node.
-        if isinstance(create_request, ReqCreateAndKeep):
-            yield from self.handle_receive_ck_request(req, create_request)
-        elif isinstance(create_request, ReqMeasureDirectly):
-            yield from self.handle_receive_md_request(req, create_request)
+        handler = self._receive_handlers.get(type(create_request))
+        if handler is not None:
+            yield from handler(req, create_request)
 
     def handle_breakpoint_create_request(
         self,
@@ -769,18 +830,15 @@ class Netstack(ComponentProtocol):
         while True:
             # Wait for a new message.
             msg = yield from self._receive_processor_msg()
-            self._logger.debug(f"received new msg from processor: {msg}")
+            # Only format log messages that would actually be emitted.
+            debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                self._logger.debug(f"received new msg from processor: {msg}")
 
             # Handle it.
-            if isinstance(msg, NetstackCreateRequest):
-                yield from self.handle_create_request(msg)
-                self._logger.debug("create request done")
-            elif isinstance(msg, NetstackReceiveRequest):
-                yield from self.handle_receive_request(msg)
-                self._logger.debug("receive request done")
-            elif isinstance(msg, NetstackBreakpointCreateRequest):
-                yield from self.handle_breakpoint_create_request()
-                self._logger.debug("breakpoint create request done")
-            elif isinstance(msg, NetstackBreakpointReceiveRequest):
-                yield from self.handle_breakpoint_receive_request()
-                self._logger.debug("breakpoint receive request done")
+            entry = self._processor_msg_handlers.get(type(msg))
+            if entry is not None:
+                handler, description = entry
+                yield from handler(msg)
+                if debug_enabled:
+                    self._logger.debug(f"{description} done")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Dict, Generator, Optional, Union
+from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Union
 
 import netsquid as ns
 from netqasm.lang.instr import NetQASMInstruction, core, nv, vanilla
@@ -153,6 +153,9 @@ class Processor(ComponentProtocol):
     def _receive_netstack_msg(self) -> Generator[EventExpression, None, str]:
         return (yield from self._receive_msg("netstack", SIGNAL_NSTK_PROC_MSG))
 
+    def _receive_all_netstack_msgs(self) -> Generator[EventExpression, None, List[str]]:
+        return (yield from self._receive_all("netstack", SIGNAL_NSTK_PROC_MSG))
+
     def _flush_netstack_msgs(self) -> None:
         self._listeners["netstack"].buffer.clear()
 
@@ -592,12 +595,13 @@ class Processor(ComponentProtocol):
 
         while True:
             values = self.app_memories[app_id].get_array_values(addr, start, end)
-            if any(v is None for v in values):
+            if None in values:
                 self._logger.debug(
                     f"waiting for netstack to write to @{addr}[{start}:{end}] "
                     f"for app ID {app_id}"
                 )
-                yield from self._receive_netstack_msg()
+                # Consume all pending notifications before checking again.
+                yield from self._receive_all_netstack_msgs()
                 self._logger.debug("netstack wrote something")
             else:
                 break
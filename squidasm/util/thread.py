@@ -1,18 +0,0 @@
-from time import sleep
-
-
-def as_completed(futures, names=None, sleep_time=0):
-    futures = list(futures)
-    if names is not None:
-        names = list(names)
-    while len(futures) > 0:
-        for i, future in enumerate(futures):
-            if future.ready():
-                futures.pop(i)
-                if names is None:
-                    yield future
-                else:
-                    name = names.pop(i)
-                    yield future, name
-        if sleep_time > 0:
-            sleep(sleep_time)
@@ -1,10 +1,14 @@
+import copy
+import pickle
 import unittest
 
 import netsquid as ns
 from netqasm.backend.messages import InitNewAppMessage, OpenEPRSocketMessage
+from netsquid.components.component import Component, Message
 
 from squidasm.run.stack.build import build_nv_qdevice
 from squidasm.run.stack.config import NVQDeviceConfig
+from squidasm.sim.stack.common import NetstackCreateRequest, PortListener
 from squidasm.sim.stack.handler import Handler
 from squidasm.sim.stack.netstack import EprSocket, Netstack
 from squidasm.sim.stack.stack import NodeStack
@@ -35,6 +39,46 @@ class TestHandler(unittest.TestCase):
         self.handler.msg_from_host(OpenEPRSocketMessage(0, 2, 1))
         assert 0 in self.netstack._epr_sockets
         assert self.netstack._epr_sockets[0][0] == EprSocket(2, 1)
+        assert self.netstack.find_epr_socket(0, 2, 1) == EprSocket(2, 1)
+        assert self.netstack.find_epr_socket(0, 1, 2) is None
+
+
+class TestPortListener(unittest.TestCase):
+    def setUp(self) -> None:
+        ns.sim_reset()
+        self._comp = Component("comp", port_names=["in"])
+        self._listener = PortListener(self._comp.ports["in"], "new_msg")
+
+    def test_drain_inputs(self):
+        self._listener.start()
+        port = self._comp.ports["in"]
+
+        port.tx_input(Message("a"))
+        port.tx_input(Message("b"))
+        ns.sim_run()
+        assert list(self._listener.buffer) == ["a", "b"]
+
+        # Input arriving after a drain must still be picked up.
+        port.tx_input(Message("c"))
+        ns.sim_run()
+        assert list(self._listener.buffer) == ["a", "b", "c"]
+
+
+class TestNetstackRequest(unittest.TestCase):
+    def test_copy_and_pickle(self):
+        req = NetstackCreateRequest(
+            app_id=0,
+            remote_node_id=1,
+            epr_socket_id=0,
+            qubit_array_addr=2,
+            arg_array_addr=3,
+            result_array_addr=4,
+        )
+        assert copy.copy(req) == req
+        req_copy = copy.deepcopy(req)
+        assert req_copy == req
+        assert req_copy is not req
+        assert pickle.loads(pickle.dumps(req)) == req
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+import unittest
+
+from squidasm.sim.stack.common import (
+    AllocError,
+    AppMemory,
+    NVPhysicalQuantumMemory,
+    PhysicalQuantumMemory,
+)
+
+
+class TestPhysicalQuantumMemory(unittest.TestCase):
+    def test_allocate_lowest_free(self):
+        mem = PhysicalQuantumMemory(3)
+        assert mem.allocate() == 0
+        assert mem.allocate() == 1
+        mem.free(0)
+        assert not mem.is_allocated(0)
+        assert mem.is_allocated(1)
+        assert mem.allocate() == 0
+        assert mem.allocate() == 2
+        with self.assertRaises(AllocError):
+            mem.allocate()
+
+    def test_reallocate_lowest_after_free(self):
+        mem = PhysicalQuantumMemory(5)
+        for _ in range(5):
+            mem.allocate()
+        mem.free(3)
+        mem.free(1)
+        mem.free(4)
+        assert mem.allocate() == 1
+        assert mem.allocate() == 3
+        assert mem.allocate() == 4
+
+    def test_free_invalid(self):
+        mem = PhysicalQuantumMemory(2)
+        with self.assertRaises(AllocError):
+            mem.free(5)
+        with self.assertRaises(AllocError):
+            mem.free(-1)
+        # Double free.
+        mem.allocate()
+        mem.free(0)
+        with self.assertRaises(AllocError):
+            mem.free(0)
+        assert mem.allocate() == 0
+        assert mem.allocate() == 1
+        with self.assertRaises(AllocError):
+            mem.allocate()
+
+    def test_is_allocated_out_of_range(self):
+        mem = PhysicalQuantumMemory(2)
+        mem.allocate()
+        mem.allocate()
+        assert not mem.is_allocated(7)
+        assert not mem.is_allocated(-1)
+
+    def test_clear(self):
+        mem = PhysicalQuantumMemory(2)
+        mem.allocate()
+        mem.allocate()
+        mem.clear()
+        assert not mem.is_allocated(0)
+        assert not mem.is_allocated(1)
+        assert mem.allocate() == 0
+
+    def test_nv_comm_and_mem(self):
+        mem = NVPhysicalQuantumMemory(3)
+        assert mem.comm_qubit_count == 1
+        assert mem.allocate_mem() == 1
+        assert mem.allocate_comm() == 0
+        with self.assertRaises(AllocError):
+            mem.allocate_comm()
+        assert mem.try_allocate_comm() is None
+        mem.free(0)
+        assert mem.try_allocate_comm() == 0
+        assert mem.allocate_mem() == 2
+        with self.assertRaises(AllocError):
+            mem.allocate_mem()
+
+
+class TestAppMemory(unittest.TestCase):
+    def test_set_array_values(self):
+        mem = AppMemory(app_id=0, max_qubits=1)
+        mem.init_new_array(address=0, length=6)
+        mem.set_array_values(0, 2, [1, -1, 3])
+        assert mem.get_array(0) == [None, None, 1, -1, 3, None]
+        with self.assertRaises(IndexError):
+            mem.set_array_values(0, 4, [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()